@@ -467,10 +467,10 @@ class SixDOF_EOM(om.ExplicitComponent):
         
         # Yaw equation
 
-        yaw_accel = ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel + 
+        yaw_accel = ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel - 
                   J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + 
                   J_xz * lx_ext + 
-                  J_xz * lz_ext) / Den
+                  J_xx * lz_ext) / Den
         
         # Kinematic equations
         
@@ -604,29 +604,29 @@ class SixDOF_EOM(om.ExplicitComponent):
         J['pitch_accel', 'ly_ext'] = 1 / J_yy
 
         J['yaw_accel', 'J_xz'] = (Den * (
-            2 * J_xz * roll_ang_vel * pitch_ang_vel + (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + lx_ext + lz_ext
-        ) - ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel + 
+            2 * J_xz * roll_ang_vel * pitch_ang_vel - (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + lx_ext
+        ) - ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel - 
                   J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + 
                   J_xz * lx_ext + 
-                  J_xz * lz_ext) * -2 * J_xz) / Den**2
+                  J_xx * lz_ext) * -2 * J_xz) / Den**2
         J['yaw_accel', 'J_xx'] = (Den * (
-            2 * J_xx * roll_ang_vel * pitch_ang_vel - J_yy * roll_ang_vel * pitch_ang_vel + J_xz * pitch_ang_vel * yaw_ang_vel
-        ) - ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel + 
+            2 * J_xx * roll_ang_vel * pitch_ang_vel - J_yy * roll_ang_vel * pitch_ang_vel - J_xz * pitch_ang_vel * yaw_ang_vel + lz_ext
+        ) - ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel - 
                   J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + 
                   J_xz * lx_ext + 
-                  J_xz * lz_ext) * J_zz) / Den**2
-        J['yaw_accel', 'J_yy'] = (-J_xx * roll_ang_vel * pitch_ang_vel - J_xz * pitch_ang_vel * yaw_ang_vel) / Den
+                  J_xx * lz_ext) * J_zz) / Den**2
+        J['yaw_accel', 'J_yy'] = (-J_xx * roll_ang_vel * pitch_ang_vel + J_xz * pitch_ang_vel * yaw_ang_vel) / Den
         J['yaw_accel', 'J_zz'] = (Den * (
-            J_xz * pitch_ang_vel * yaw_ang_vel
-        ) - ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel + 
+            -J_xz * pitch_ang_vel * yaw_ang_vel
+        ) - ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel - 
                   J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + 
                   J_xz * lx_ext + 
-                  J_xz * lz_ext) * J_xx) / Den**2
+                  J_xx * lz_ext) * J_xx) / Den**2
         J['yaw_accel', 'roll_ang_vel'] = ((J_xx * (J_xx - J_yy) + J_xz**2) * pitch_ang_vel) / Den
-        J['yaw_accel', 'pitch_ang_vel'] = ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel + J_xz * (J_xx - J_yy + J_zz) * yaw_ang_vel) / Den
-        J['yaw_accel', 'yaw_ang_vel'] = (J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel) / Den
+        J['yaw_accel', 'pitch_ang_vel'] = ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel - J_xz * (J_xx - J_yy + J_zz) * yaw_ang_vel) / Den
+        J['yaw_accel', 'yaw_ang_vel'] = -(J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel) / Den
         J['yaw_accel', 'lx_ext'] = J_xz / Den
-        J['yaw_accel', 'lz_ext'] = J_xz / Den
+        J['yaw_accel', 'lz_ext'] = J_xx / Den
 
         J['roll_angle_rate_eq', 'roll_ang_vel'] = 1 
         J['roll_angle_rate_eq', 'pitch_ang_vel'] = np.sin(roll) * np.tan(pitch)
@@ -1,26 +1,17 @@
 import openmdao.api as om
 import numpy as np
-from scipy.interpolate import interp1d
 
 import jax.numpy as jnp
 import openmdao.jax as omj
-import jax.scipy.interpolate as jinterp
 
 from aviary.variable_info.variables import Aircraft
 from aviary.variable_info.functions import add_aviary_output, add_aviary_input
 
-try:
-    from quadax import quadgk
-except ImportError:
-    raise ImportError(
-        "quadax package not found. You can install it by running 'pip install quadax'."
-    )
-
 from aviary.subsystems.mass.simple_mass.materials_database import materials
 
 from aviary.utils.named_values import get_keys
 
-Debug = True
+Debug = False
 
 class FuselageMassAndCOG(om.JaxExplicitComponent):
     def initialize(self):
@@ -39,6 +30,13 @@ class FuselageMassAndCOG(om.JaxExplicitComponent):
         
         self.custom_fuselage_function = None
 
+    def get_self_statics(self):
+        # compute_primal branches on these, so a change must trigger a new trace
+        return (self.options['num_sections'],
+                self.options['material'],
+                self.options['custom_fuselage_data_file'],
+                self.custom_fuselage_function)
+
     def setup(self):
         self.options['use_jit'] = not(Debug)
 
@@ -82,52 +80,77 @@ class FuselageMassAndCOG(om.JaxExplicitComponent):
                           Aircraft.Fuselage.MASS, 
                           units='kg')
     
-    def compute_primal(self, aircraft__fuselage__length, base_diameter, tip_diameter, curvature, thickness, y_offset, z_offset, is_hollow):
-        # Input validation checks
-        if aircraft__fuselage__length <= 0:
-            raise ValueError("Length must be greater than zero.")
-        
-        if base_diameter <= 0 or tip_diameter <= 0:
-            raise ValueError("Diameter must be greater than zero.")
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        # Input validation checks -- done here on the concrete values, since compute_primal is traced under jit
+        self.validate_inputs(inputs[Aircraft.Fuselage.LENGTH].real,
+                             inputs['base_diameter'].real,
+                             inputs['thickness'].real,
+                             inputs['tip_diameter'].real,
+                             inputs['is_hollow'].real)
+
+        super().compute(inputs, outputs, discrete_inputs, discrete_outputs)
 
+    def compute_primal(self, aircraft__fuselage__length, base_diameter, tip_diameter, curvature, thickness, y_offset, z_offset, is_hollow):
         custom_fuselage_function = getattr(self, 'custom_fuselage_function', None) # Custom fuselage model function -- if provided
 
         custom_fuselage_data_file = self.options['custom_fuselage_data_file']
 
         material = self.options['material']
         num_sections = self.options['num_sections']
-        
-        self.validate_inputs(aircraft__fuselage__length, base_diameter, thickness, tip_diameter, is_hollow)
 
         density, _ = materials.get_item(material)
 
-        section_locations = jnp.linspace(0, aircraft__fuselage__length, num_sections)
-        
-        aircraft__fuselage__mass = 0
-        total_moment_x = 0
-        total_moment_y = 0
-        total_moment_z = 0
-
         interpolate_diameter = self.load_fuselage_data(custom_fuselage_data_file)
 
-        # Loop through each section
-        for location in section_locations:
-            section_diameter = self.get_section_diameter(location, aircraft__fuselage__length, base_diameter, tip_diameter, interpolate_diameter)
-            outer_radius = section_diameter / 2.0 
-            inner_radius = jnp.where(is_hollow, omj.smooth_max(0, outer_radius - thickness), 0)
+        if not custom_fuselage_function and interpolate_diameter is None:
+            # Linear taper -- the mass integral is a closed-form polynomial, no need to sample sections
+            return self.compute_linear_taper_mass(aircraft__fuselage__length, base_diameter, tip_diameter, thickness, is_hollow, density)
 
-            section_volume = jnp.pi * (outer_radius**2 - inner_radius**2) * (aircraft__fuselage__length / num_sections)
-            section_weight = density * section_volume
+        section_locations = jnp.linspace(0, aircraft__fuselage__length, num_sections)
+
+        # Evaluate all sections at once
+        section_diameters = self.get_section_diameter(section_locations, aircraft__fuselage__length, base_diameter, tip_diameter, interpolate_diameter)
+        outer_radius = section_diameters / 2.0
+        inner_radius = jnp.where(is_hollow, omj.smooth_max(0, outer_radius - thickness), 0)
+
+        # Mass per unit of (r_o**2 - r_i**2), the same for every section
+        section_mass_factor = density * jnp.pi * (aircraft__fuselage__length / num_sections)
+        section_weight = section_mass_factor * (outer_radius**2 - inner_radius**2)
 
-            centroid_x, centroid_y, centroid_z = self.compute_centroid(location, aircraft__fuselage__length, y_offset, z_offset, curvature, base_diameter, tip_diameter)
+        centroid_x, centroid_y, centroid_z = self.compute_centroid(section_locations, aircraft__fuselage__length, y_offset, z_offset, curvature, base_diameter, tip_diameter)
 
-            aircraft__fuselage__mass += section_weight
-            total_moment_x += centroid_x * section_weight
-            total_moment_y += centroid_y * section_weight
-            total_moment_z += centroid_z * section_weight
+        aircraft__fuselage__mass = jnp.sum(section_weight, axis=0)
+        total_moment_x = jnp.sum(centroid_x * section_weight, axis=0)
+        total_moment_y = jnp.sum(centroid_y * section_weight, axis=0)
+        total_moment_z = jnp.sum(centroid_z * section_weight, axis=0)
 
         return aircraft__fuselage__mass
 
+    def compute_linear_taper_mass(self, length, base_diameter, tip_diameter, thickness, is_hollow, density):
+        """Exact mass of a hollow (or solid) cone frustum whose outer radius varies linearly from base to tip."""
+        base_radius = base_diameter / 2.0
+        tip_radius = tip_diameter / 2.0
+
+        # Integral of r(x)**2 over the length, for r linear from r_b to r_t: L * (r_b**2 + r_b*r_t + r_t**2) / 3
+        outer_integral = (base_radius**2 + base_radius * tip_radius + tip_radius**2) / 3.0
+
+        # The inner radius is max(r - thickness, 0), which is still linear where it is positive
+        inner_base = base_radius - thickness
+        inner_tip = tip_radius - thickness
+        inner_full = (inner_base**2 + inner_base * inner_tip + inner_tip**2) / 3.0
+
+        # If the wall closes up somewhere along the length, only integrate up to that point
+        clipped_base = omj.smooth_max(0, inner_base)
+        clipped_tip = omj.smooth_max(0, inner_tip)
+        inner_slope = inner_tip - inner_base
+        safe_slope = jnp.where(jnp.abs(inner_slope) > 1e-30, inner_slope, 1.0)
+        inner_clipped = (clipped_tip**3 - clipped_base**3) / (3.0 * safe_slope)
+
+        inner_integral = jnp.where((inner_base > 0) & (inner_tip > 0), inner_full, inner_clipped)
+        inner_integral = jnp.where(is_hollow, inner_integral, 0)
+
+        return density * jnp.pi * length * (outer_integral - inner_integral)
+
     def validate_inputs(self, length, base_diameter, thickness, tip_diameter, is_hollow):
         if length <= 0 or base_diameter <= 0 or tip_diameter <= 0 or thickness <= 0:
             raise ValueError("Length, diameter, and thickness must be positive values.")
@@ -139,26 +162,28 @@ class FuselageMassAndCOG(om.JaxExplicitComponent):
             try:
                 # Load the file
                 custom_data = np.loadtxt(custom_fuselage_data_file)
-                fuselage_locations = custom_data[:, 0]
-                fuselage_diameters = custom_data[:, 1]
-                return jinterp.RegularGridInterpolator(fuselage_locations, fuselage_diameters, kind='linear', fill_value='extrapolate')
+                self._fuselage_locations = jnp.asarray(custom_data[:, 0])
+                self._fuselage_diameters = jnp.asarray(custom_data[:, 1])
             except Exception as e:
                 raise ValueError(f"Error loading fuselage data file: {e}")
+            # Piecewise-linear in location, same semantics as np.interp (held constant past the end points)
+            return lambda location: jnp.interp(location, self._fuselage_locations, self._fuselage_diameters)
         else:
             return None
     
     def get_section_diameter(self, location, length, base_diameter, tip_diameter, interpolate_diameter):
         if self.custom_fuselage_function:
             return self.custom_fuselage_function(location)
-        elif self.load_fuselage_data:
-            return interpolate_diameter(location) if interpolate_diameter is not None else base_diameter + ((tip_diameter - base_diameter) / length) * location
+        elif interpolate_diameter is not None:
+            return interpolate_diameter(location)
         else:
             return base_diameter + ((tip_diameter - base_diameter) / length) * location
     
     def compute_centroid(self, location, length, y_offset, z_offset, curvature, base_diameter, tip_diameter):
         centroid_x = jnp.where(tip_diameter / base_diameter != 1, (3/4) * location, location)
-        centroid_y = y_offset * (1 - location / length)
-        centroid_z = z_offset * (1 - location / length) + curvature * location**2 / length
+        inv_length = 1.0 / length
+        centroid_y = y_offset * (1 - location * inv_length)
+        centroid_z = z_offset * (1 - location * inv_length) + curvature * location**2 * inv_length
         return centroid_x, centroid_y, centroid_z
 
 
@@ -1,5 +1,8 @@
+import os
+
 import numpy as np
 
+import jax
 import openmdao.api as om
 
 
@@ -10,6 +13,21 @@ from aviary.variable_info.variables import Aircraft
 from aviary.variable_info.functions import add_aviary_input
 
 
+def _enable_jax_compilation_cache():
+    """
+    Point jax's persistent compilation cache at $AVIARY_JAX_CACHE, if it is set.
+
+    jax.config is process-wide, so this runs once when the module is imported.
+    """
+    jax_cache_dir = os.environ.get('AVIARY_JAX_CACHE')
+    if jax_cache_dir:
+        jax.config.update('jax_compilation_cache_dir', jax_cache_dir)
+        jax.config.update('jax_persistent_cache_min_compile_time_secs', 0.1)
+
+
+_enable_jax_compilation_cache()
+
+
 class MassSummation(om.Group):
     """
 
@@ -49,7 +67,7 @@ class MassSummation(om.Group):
             promotes_outputs=['*']
         )
 
-class StructureMass(om.JaxExplicitComponent):
+class StructureMass(om.ExplicitComponent):
     def initialize(self):
         self.options.declare('tail_type', 
                      default='horizontal',
@@ -85,13 +103,26 @@ class StructureMass(om.JaxExplicitComponent):
                         val=0.0, 
                         units='kg')
 
-    def compute_primal(self, aircraft__wing__mass, aircraft__fuselage__mass, aircraft__horizontal_tail__mass, aircraft__vertical_tail__mass):
+    def setup_partials(self):
+        tail_type = self.options['tail_type']
+
+        # Plain sum of the component masses, so the partials are constant
+        self.declare_partials('structure_mass', [Aircraft.Wing.MASS, Aircraft.Fuselage.MASS], val=1.0)
 
+        if tail_type == 'horizontal':
+            self.declare_partials('structure_mass', Aircraft.HorizontalTail.MASS, val=1.0)
+        else:
+            self.declare_partials('structure_mass', Aircraft.VerticalTail.MASS, val=1.0)
+
+    def compute(self, inputs, outputs):
         tail_type = self.options['tail_type']
 
+        wing_mass = inputs[Aircraft.Wing.MASS]
+        fuselage_mass = inputs[Aircraft.Fuselage.MASS]
+
         if tail_type == 'horizontal':
-            structure_mass = aircraft__wing__mass + aircraft__fuselage__mass + aircraft__horizontal_tail__mass
+            tail_mass = inputs[Aircraft.HorizontalTail.MASS]
         else:
-            structure_mass = aircraft__wing__mass + aircraft__fuselage__mass + aircraft__vertical_tail__mass
+            tail_mass = inputs[Aircraft.VerticalTail.MASS]
 
-        return structure_mass
\ No newline at end of file
+        outputs['structure_mass'] = wing_mass + fuselage_mass + tail_mass
@@ -1,7 +1,9 @@
-import numpy as np
+import jax.numpy as jnp
 import openmdao.api as om
 
-class SixDOF_EOM(om.ExplicitComponent):
+Debug = False
+
+class SixDOF_EOM(om.JaxExplicitComponent):
     """
     Six DOF EOM component, with particular emphasis for rotorcraft. 
     ASSUMPTIONS:
@@ -17,6 +19,8 @@ class SixDOF_EOM(om.ExplicitComponent):
     """
     
     def setup(self):
+        self.options['use_jit'] = not(Debug)
+
         self.add_input(
             'mass',
             val=0.0,
@@ -289,117 +293,122 @@ class SixDOF_EOM(om.ExplicitComponent):
             desc="z-position derivative of aircraft COM wrt point in NED CS"
         )
     
-    def compute(self, inputs, outputs):
+    def compute_primal(self,
+                       mass,
+                       axial_vel, # u
+                       lat_vel, # v
+                       vert_vel, # w
+                       roll_ang_vel, # p
+                       pitch_ang_vel, # q
+                       yaw_ang_vel, # r
+                       roll, # phi
+                       pitch, # theta
+                       yaw, # psi
+                       x, # p1
+                       y, # p2
+                       z, # p3
+                       time,
+                       g,
+                       Fx_ext,
+                       Fy_ext,
+                       Fz_ext,
+                       lx_ext, # l
+                       ly_ext, # m
+                       lz_ext, # n
+                       J_xz,
+                       J_xx,
+                       J_yy,
+                       J_zz):
         """
         Compute function for EOM. 
-        TODO: Same as above, potentially rewrite equations for \
-              matrix form, and add potential assymetry to moment \
-              of inertia matrix.
+        TODO: Same as above, potentially rewrite the rotational \
+              equations in matrix form, and add potential assymetry \
+              to moment of inertia matrix.
 
         """
 
-        # inputs
-
-        mass = inputs['mass']
-        axial_vel = inputs['axial_vel'] # u
-        lat_vel = inputs['lat_vel'] # v
-        vert_vel = inputs['vert_vel'] # w
-        roll_ang_vel = inputs['roll_ang_vel'] # p
-        pitch_ang_vel = inputs['pitch_ang_vel'] # q
-        yaw_ang_vel = inputs['yaw_ang_vel'] # r
-        roll = inputs['roll'] # phi
-        pitch = inputs['pitch'] # theta
-        yaw = inputs['yaw'] # psi
-        x = inputs['x'] # p1
-        y = inputs['y'] # p2
-        z = inputs['z'] # p3
-        time = inputs['time']
-        g = inputs['g']
-        Fx_ext = inputs['Fx_ext']
-        Fy_ext = inputs['Fy_ext']
-        Fz_ext = inputs['Fz_ext']
-        lx_ext = inputs['lx_ext'] # l
-        ly_ext = inputs['ly_ext'] # m
-        lz_ext = inputs['lz_ext'] # n
-        J_xz = inputs['J_xz']
-        J_xx = inputs['J_xx']
-        J_yy = inputs['J_yy']
-        J_zz = inputs['J_zz']
+        # Trig terms of the Euler angles, shared by the equations below
+        sin_roll = jnp.sin(roll)
+        cos_roll = jnp.cos(roll)
+        sin_pitch = jnp.sin(pitch)
+        cos_pitch = jnp.cos(pitch)
+        tan_pitch = jnp.tan(pitch)
+        sin_yaw = jnp.sin(yaw)
+        cos_yaw = jnp.cos(yaw)
+
+        inv_mass = 1 / mass
 
         # Resolve gravity in body coordinate system -- denoted with subscript 'b'
-        gx_b = -np.sin(pitch) * g
-        gy_b = np.sin(roll) * np.cos(pitch) * g
-        gz_b = np.cos(roll) * np.cos(pitch) * g
+        gx_b = -sin_pitch * g
+        gy_b = sin_roll * cos_pitch * g
+        gz_b = cos_roll * cos_pitch * g
 
         # TODO: could add external forces and moments here if needed
 
         # Denominator for roll and yaw rate equations
         Den = J_xx * J_zz - J_xz**2
+        inv_Den = 1 / Den
+        inv_J_yy = 1 / J_yy
 
         # roll-axis velocity equation
 
-        dx_accel = 1 / mass * Fx_ext + gx_b - vert_vel * pitch_ang_vel + lat_vel * yaw_ang_vel
+        dx_accel = inv_mass * Fx_ext + gx_b - vert_vel * pitch_ang_vel + lat_vel * yaw_ang_vel
 
         # pitch-axis velocity equation
 
-        dy_accel = 1 / mass * Fy_ext + gy_b - axial_vel * yaw_ang_vel + vert_vel * roll_ang_vel
+        dy_accel = inv_mass * Fy_ext + gy_b - axial_vel * yaw_ang_vel + vert_vel * roll_ang_vel
 
         # yaw-axis velocity equation
 
-        dz_accel = 1 / mass * Fz_ext + gz_b - lat_vel * roll_ang_vel + axial_vel * pitch_ang_vel
+        dz_accel = inv_mass * Fz_ext + gz_b - lat_vel * roll_ang_vel + axial_vel * pitch_ang_vel
+
+        # Inertia term shared by the roll and yaw equations
+        K = J_xz * (J_xx - J_yy + J_zz)
 
         # Roll equation
 
-        roll_accel = (J_xz * (J_xx - J_yy + J_zz) * roll_ang_vel * pitch_ang_vel - 
+        roll_accel = (K * roll_ang_vel * pitch_ang_vel - 
                    (J_zz * (J_zz - J_yy) + J_xz**2) * pitch_ang_vel * yaw_ang_vel + 
                    J_zz * lx_ext + 
-                   J_xz * lz_ext) / Den
+                   J_xz * lz_ext) * inv_Den
         
         # Pitch equation
 
         pitch_accel = ((J_zz - J_xx) * roll_ang_vel * yaw_ang_vel - 
-                    J_xz * (roll_ang_vel**2 - yaw_ang_vel**2) + ly_ext) / J_yy
+                    J_xz * (roll_ang_vel**2 - yaw_ang_vel**2) + ly_ext) * inv_J_yy
         
         # Yaw equation
 
-        yaw_accel = ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel + 
-                  J_xz * (J_xx - J_yy + J_zz) * pitch_ang_vel * yaw_ang_vel + 
+        yaw_accel = ((J_xx * (J_xx - J_yy) + J_xz**2) * roll_ang_vel * pitch_ang_vel - 
+                  K * pitch_ang_vel * yaw_ang_vel + 
                   J_xz * lx_ext + 
-                  J_xz * lz_ext) / Den
+                  J_xx * lz_ext) * inv_Den
         
-        # Kinematic equations
-        
-        roll_angle_rate_eq = roll_ang_vel + np.sin(roll) * np.tan(pitch) * pitch_ang_vel + \
-                             np.cos(roll) * np.tan(pitch) * yaw_ang_vel
-        
-        pitch_angle_rate_eq = np.cos(roll) * pitch_ang_vel - np.sin(roll) * yaw_ang_vel
+        # Kinematic equations -- Euler angle rates from the body angular rates
 
-        yaw_angle_rate_eq = np.sin(roll) / np.cos(pitch) * pitch_ang_vel + \
-                            np.cos(roll) / np.cos(pitch) * yaw_ang_vel
+        T = jnp.array([
+            [jnp.ones_like(roll), sin_roll * tan_pitch, cos_roll * tan_pitch],
+            [jnp.zeros_like(roll), cos_roll, -sin_roll],
+            [jnp.zeros_like(roll), sin_roll / cos_pitch, cos_roll / cos_pitch]
+        ])
 
-        # Position equations
+        ang_vel = jnp.array([roll_ang_vel, pitch_ang_vel, yaw_ang_vel])
 
-        dx_dt = np.cos(pitch) * np.cos(yaw) * axial_vel + \
-                (-np.cos(roll) * np.sin(yaw) + np.sin(roll) * np.sin(pitch) * np.cos(yaw)) * lat_vel + \
-                (np.sin(roll) * np.sin(yaw) + np.cos(roll) * np.sin(pitch) * np.cos(yaw)) * vert_vel
-        
-        dy_dt = np.cos(pitch) * np.sin(yaw) * axial_vel + \
-                (np.cos(roll) * np.cos(yaw) + np.sin(roll) * np.sin(pitch) * np.sin(yaw)) * lat_vel + \
-                (-np.sin(roll) * np.cos(yaw) + np.cos(roll) * np.sin(pitch) * np.sin(yaw)) * vert_vel
-        
-        dz_dt = -np.sin(pitch) * axial_vel + \
-                np.sin(roll) * np.cos(pitch) * lat_vel + \
-                np.cos(roll) * np.cos(pitch) * vert_vel
-
-        outputs['dx_accel'] = dx_accel
-        outputs['dy_accel'] = dy_accel
-        outputs['dz_accel'] = dz_accel
-        outputs['roll_accel'] = roll_accel
-        outputs['pitch_accel'] = pitch_accel
-        outputs['yaw_accel'] = yaw_accel
-        outputs['roll_angle_rate_eq'] = roll_angle_rate_eq
-        outputs['pitch_angle_rate_eq'] = pitch_angle_rate_eq
-        outputs['yaw_angle_rate_eq'] = yaw_angle_rate_eq
-        outputs['dx_dt'] = dx_dt
-        outputs['dy_dt'] = dy_dt
-        outputs['dz_dt'] = dz_dt
\ No newline at end of file
+        roll_angle_rate_eq, pitch_angle_rate_eq, yaw_angle_rate_eq = jnp.einsum('ij...,j...->i...', T, ang_vel)
+
+        # Position equations -- body to NED rotation of the body velocity
+
+        R = jnp.array([
+            [cos_pitch * cos_yaw, -cos_roll * sin_yaw + sin_roll * sin_pitch * cos_yaw, sin_roll * sin_yaw + cos_roll * sin_pitch * cos_yaw],
+            [cos_pitch * sin_yaw, cos_roll * cos_yaw + sin_roll * sin_pitch * sin_yaw, -sin_roll * cos_yaw + cos_roll * sin_pitch * sin_yaw],
+            [-sin_pitch, sin_roll * cos_pitch, cos_roll * cos_pitch]
+        ])
+
+        vel_body = jnp.array([axial_vel, lat_vel, vert_vel])
+
+        dx_dt, dy_dt, dz_dt = jnp.einsum('ij...,j...->i...', R, vel_body)
+
+        return (dx_accel, dy_accel, dz_accel,
+                roll_accel, pitch_accel, yaw_accel,
+                roll_angle_rate_eq, pitch_angle_rate_eq, yaw_angle_rate_eq,
+                dx_dt, dy_dt, dz_dt)
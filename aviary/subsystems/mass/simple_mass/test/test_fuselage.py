@@ -1,5 +1,6 @@
 import unittest
 
+import jax.numpy as jnp
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
 
@@ -84,6 +85,51 @@ class FuselageMassTestCase(unittest.TestCase):
             partial_data,
             atol=1e-12,
             rtol=1e-12)
-        
+
+    def test_change_statics(self):
+        # Non-linear profile, so that the sampled section sum depends on num_sections
+        self.prob.model.fuselage.custom_fuselage_function = lambda location: (
+            0.5 * jnp.exp(-0.2 * location)
+        )
+
+        self.prob.run_model()
+        mass_10 = self.prob.get_val(Aircraft.Fuselage.MASS).copy()
+
+        # Linearizing builds the jitted compute_primal that later runs reuse
+        self.prob.model.run_linearize()
+
+        self.prob.model.fuselage.options['num_sections'] = 40
+
+        self.prob.run_model()
+        mass_40 = self.prob.get_val(Aircraft.Fuselage.MASS)
+
+        prob_40 = om.Problem()
+        prob_40.model.add_subsystem(
+            'fuselage',
+            FuselageMassAndCOG(num_sections=40),
+            promotes_inputs=['*'],
+            promotes_outputs=['*'],
+        )
+        prob_40.setup(check=False)
+        prob_40.model.fuselage.custom_fuselage_function = (
+            self.prob.model.fuselage.custom_fuselage_function
+        )
+
+        for name in [
+            Aircraft.Fuselage.LENGTH,
+            'base_diameter',
+            'tip_diameter',
+            'thickness',
+            'is_hollow',
+        ]:
+            prob_40.set_val(name, self.prob.get_val(name))
+
+        prob_40.run_model()
+
+        # The option change must retrace compute_primal rather than reuse the 10 section trace
+        self.assertGreater(abs(mass_40[0] - mass_10[0]), 1e-3)
+
+        assert_near_equal(mass_40, prob_40.get_val(Aircraft.Fuselage.MASS), 1e-12)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
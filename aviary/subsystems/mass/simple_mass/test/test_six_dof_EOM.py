@@ -0,0 +1,128 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_check_partials, assert_near_equal
+
+from aviary.subsystems.mass.simple_mass.six_dof_EOM import SixDOF_EOM
+
+
+class SixDOFEOMTestCase(unittest.TestCase):
+    """Six DOF EOM test case."""
+
+    def setUp(self):
+
+        self.prob = om.Problem(reports=False)
+        self.prob.model.add_subsystem(
+            'EOM',
+            SixDOF_EOM(),
+            promotes_inputs=['*'],
+            promotes_outputs=['*'],
+        )
+
+        self.prob.setup(check=False, force_alloc_complex=True)
+
+        self.prob.set_val('mass', 2.0, units='kg')
+        self.prob.set_val('roll_ang_vel', 0.3, units='rad/s')
+        self.prob.set_val('pitch_ang_vel', -0.2, units='rad/s')
+        self.prob.set_val('yaw_ang_vel', 0.5, units='rad/s')
+        self.prob.set_val('lx_ext', 0.4, units='kg*m**2/s**2')
+        self.prob.set_val('ly_ext', -0.1, units='kg*m**2/s**2')
+        self.prob.set_val('lz_ext', 0.7, units='kg*m**2/s**2')
+        self.prob.set_val('J_xx', 1.5, units='kg*m**2')
+        self.prob.set_val('J_yy', 2.5, units='kg*m**2')
+        self.prob.set_val('J_zz', 3.0, units='kg*m**2')
+        self.prob.set_val('J_xz', 0.4, units='kg*m**2')
+
+    def test_angular_accel(self):
+
+        self.prob.run_model()
+
+        # Euler's equations, J * omega_dot = M - omega x (J * omega), solved directly
+        J = np.array([[1.5, 0.0, -0.4], [0.0, 2.5, 0.0], [-0.4, 0.0, 3.0]])
+        omega = np.array([0.3, -0.2, 0.5])
+        moments = np.array([0.4, -0.1, 0.7])
+
+        omega_dot = np.linalg.solve(J, moments - np.cross(omega, J @ omega))
+
+        tol = 1e-12
+
+        assert_near_equal(self.prob.get_val('roll_accel', units='rad/s**2'), omega_dot[0], tol)
+
+        assert_near_equal(self.prob.get_val('pitch_accel', units='rad/s**2'), omega_dot[1], tol)
+
+        assert_near_equal(self.prob.get_val('yaw_accel', units='rad/s**2'), omega_dot[2], tol)
+
+    def test_kinematics(self):
+
+        roll, pitch, yaw = 0.4, -0.3, 1.1
+        vel_body = np.array([30.0, -2.0, 1.5])
+
+        self.prob.set_val('roll', roll, units='rad')
+        self.prob.set_val('pitch', pitch, units='rad')
+        self.prob.set_val('yaw', yaw, units='rad')
+        self.prob.set_val('axial_vel', vel_body[0], units='m/s')
+        self.prob.set_val('lat_vel', vel_body[1], units='m/s')
+        self.prob.set_val('vert_vel', vel_body[2], units='m/s')
+
+        self.prob.run_model()
+
+        # Body to NED direction cosine matrix for the 3-2-1 sequence, R = Rz(yaw) Ry(pitch) Rx(roll)
+        Rx = np.array(
+            [[1.0, 0.0, 0.0], [0.0, np.cos(roll), -np.sin(roll)], [0.0, np.sin(roll), np.cos(roll)]]
+        )
+        Ry = np.array(
+            [
+                [np.cos(pitch), 0.0, np.sin(pitch)],
+                [0.0, 1.0, 0.0],
+                [-np.sin(pitch), 0.0, np.cos(pitch)],
+            ]
+        )
+        Rz = np.array(
+            [[np.cos(yaw), -np.sin(yaw), 0.0], [np.sin(yaw), np.cos(yaw), 0.0], [0.0, 0.0, 1.0]]
+        )
+        vel_ned = Rz @ Ry @ Rx @ vel_body
+
+        # Euler angle rates from the body angular rates
+        p, q, r = 0.3, -0.2, 0.5
+        euler_rates = np.array(
+            [
+                p + (q * np.sin(roll) + r * np.cos(roll)) * np.tan(pitch),
+                q * np.cos(roll) - r * np.sin(roll),
+                (q * np.sin(roll) + r * np.cos(roll)) / np.cos(pitch),
+            ]
+        )
+
+        tol = 1e-12
+
+        for name, expected in zip(['dx_dt', 'dy_dt', 'dz_dt'], vel_ned):
+            assert_near_equal(self.prob.get_val(name, units='m/s'), expected, tol)
+
+        for name, expected in zip(
+            ['roll_angle_rate_eq', 'pitch_angle_rate_eq', 'yaw_angle_rate_eq'], euler_rates
+        ):
+            assert_near_equal(self.prob.get_val(name, units='rad/s'), expected, tol)
+
+    def test_partials(self):
+
+        # Move off the zero defaults so that every dependent partial is exercised
+        self.prob.set_val('axial_vel', 30.0, units='m/s')
+        self.prob.set_val('lat_vel', -2.0, units='m/s')
+        self.prob.set_val('vert_vel', 1.5, units='m/s')
+        self.prob.set_val('roll', 0.4, units='rad')
+        self.prob.set_val('pitch', -0.3, units='rad')
+        self.prob.set_val('yaw', 1.1, units='rad')
+        self.prob.set_val('g', 9.81, units='m/s**2')
+        self.prob.set_val('Fx_ext', 3.0, units='N')
+        self.prob.set_val('Fy_ext', -1.0, units='N')
+        self.prob.set_val('Fz_ext', 2.0, units='N')
+
+        self.prob.run_model()
+
+        partial_data = self.prob.check_partials(out_stream=None, method='cs')
+
+        assert_check_partials(partial_data, atol=1e-12, rtol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from aviary.utils.test_utils.assert_utils import assert_all_near_equal
+
+
+class AssertAllNearEqualTest(unittest.TestCase):
+    """Test the table based tolerance check in assert_all_near_equal."""
+
+    def test_relative(self):
+        outputs = {'a': np.array([100.0]), 'b': np.array([-2.0])}
+
+        assert_all_near_equal(outputs, [('a', 100.04), ('b', -2.0)], 5e-4)
+
+        with self.assertRaises(AssertionError) as cm:
+            assert_all_near_equal(outputs, [('a', 100.1), ('b', -2.0)], 5e-4)
+
+        self.assertIn('1 value(s) outside tolerance', str(cm.exception))
+        self.assertIn('a: ', str(cm.exception))
+
+    def test_absolute_at_zero(self):
+        outputs = {'a': np.array([3e-5])}
+
+        # Expected value of zero, so the error is absolute rather than relative
+        assert_all_near_equal(outputs, [('a', 0.0)], 5e-5)
+
+        with self.assertRaises(AssertionError):
+            assert_all_near_equal(outputs, [('a', 0.0)], 1e-5)
+
+    def test_entry_tolerance(self):
+        outputs = {'a': np.array([101.0]), 'b': np.array([50.0])}
+
+        # The third element overrides the shared tolerance for that entry only
+        assert_all_near_equal(outputs, [('a', 100.0, 2e-2), ('b', 50.0)], 1e-6)
+
+        with self.assertRaises(AssertionError) as cm:
+            assert_all_near_equal(outputs, [('a', 100.0, 1e-3), ('b', 50.0)], 2e-2)
+
+        self.assertIn('a: ', str(cm.exception))
+
+    def test_array_output(self):
+        outputs = {'a': np.array([1.0, 2.0, 3.0])}
+
+        assert_all_near_equal(outputs, [('a', np.array([1.0, 2.0, 3.0]))], 1e-12)
+
+        # A mismatch past the first element must still be caught
+        with self.assertRaises(AssertionError):
+            assert_all_near_equal(outputs, [('a', np.array([1.0, 2.0, 4.0]))], 1e-3)
+
+    def test_reports_all_failures(self):
+        outputs = {'a': np.array([1.0]), 'b': np.array([2.0]), 'c': np.array([3.0])}
+
+        with self.assertRaises(AssertionError) as cm:
+            assert_all_near_equal(outputs, [('a', 1.5), ('b', 2.0), ('c', 3.5)], 1e-6)
+
+        msg = str(cm.exception)
+        self.assertIn('2 value(s) outside tolerance', msg)
+        self.assertIn('a: ', msg)
+        self.assertIn('c: ', msg)
+        self.assertNotIn('b: ', msg)
+
+    def test_vectorized_pass(self):
+        outputs = {'a': np.array([100.0]), 'b': np.array([0.0, 2.0]), 'c': np.array([1e-6])}
+        expected = [('a', 100.01), ('b', np.array([0.0, 2.0])), ('c', 0.0, 1e-5)]
+
+        # A passing table is decided by the vectorized check alone
+        with mock.patch(
+            'aviary.utils.test_utils.assert_utils.assert_near_equal',
+            side_effect=AssertionError('per-entry check should not run'),
+        ):
+            assert_all_near_equal(outputs, expected, 5e-4)
+
+    def test_nan_and_shape_mismatch(self):
+        outputs = {'a': np.array([np.nan]), 'b': np.array([1.0, 2.0])}
+
+        with self.assertRaises(AssertionError) as cm:
+            assert_all_near_equal(outputs, [('a', 1.0), ('b', np.array([1.0, 2.0, 3.0]))], 1e-3)
+
+        msg = str(cm.exception)
+        self.assertIn('2 value(s) outside tolerance', msg)
+        self.assertIn('a: ', msg)
+        self.assertIn('b: ', msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 """Utilities used for testing Aviary code."""
 
+import numpy as np
 from dymos.utils.testing_utils import assert_timeseries_near_equal
+from openmdao.utils.assert_utils import assert_near_equal
 
 
 def warn_timeseries_near_equal(
@@ -13,3 +15,73 @@ def warn_timeseries_near_equal(
         )
     except AssertionError as exc:
         print('Warning:\n', str(exc))
+
+
+def assert_all_near_equal(outputs, expected, tolerance):
+    """
+    Check a table of outputs against their expected values, reporting every mismatch at once.
+
+    The error measure is the one assert_near_equal uses: the norm of the difference relative
+    to the norm of the expected value, or the absolute norm where the expected value is zero.
+    Array outputs are compared in full. All entries are checked together in one vectorized
+    pass; only when that finds a problem is each entry run through assert_near_equal to build
+    the failure message.
+
+    Parameters
+    ----------
+    outputs : dict
+        Output values keyed by variable name.
+    expected : sequence of tuple
+        (name, value) pairs, or (name, value, tolerance) triples for entries that need their
+        own tolerance.
+    tolerance : float
+        Largest acceptable error for entries without their own tolerance.
+    """
+    if _all_within_tolerance(outputs, expected, tolerance):
+        return
+
+    failures = []
+    for key, desired, *entry_tolerance in expected:
+        try:
+            assert_near_equal(
+                outputs[key], desired, entry_tolerance[0] if entry_tolerance else tolerance
+            )
+        except ValueError as err:
+            failures.append(f'{key}: {err}')
+
+    if failures:
+        msg = '\n'.join(failures)
+        raise AssertionError(f'{len(failures)} value(s) outside tolerance:\n{msg}')
+
+
+def _all_within_tolerance(outputs, expected, tolerance):
+    """
+    Return True if every entry of an assert_all_near_equal table is within its tolerance.
+
+    False means the table needs the per-entry check, either because a value is out of
+    tolerance or because it has NaNs or a size mismatch that assert_near_equal reports itself.
+    """
+    actual = [np.ravel(outputs[entry[0]]) for entry in expected]
+    desired = [np.ravel(entry[1]) for entry in expected]
+    sizes = np.array([val.size for val in actual])
+
+    if not len(actual) or np.any(sizes == 0) or sizes.tolist() != [val.size for val in desired]:
+        return False
+
+    actual = np.concatenate(actual).astype(float)
+    desired = np.concatenate(desired).astype(float)
+    if np.isnan(actual).any() or np.isnan(desired).any():
+        return False
+
+    # Per entry norms of the difference and of the expected value
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    diff_norm = np.sqrt(np.add.reduceat((actual - desired) ** 2, starts))
+    desired_norm = np.sqrt(np.add.reduceat(desired**2, starts))
+
+    nonzero = desired_norm != 0.0
+    error = diff_norm
+    error[nonzero] /= desired_norm[nonzero]
+
+    tolerances = np.array([entry[2] if len(entry) > 2 else tolerance for entry in expected])
+
+    return bool(np.all(error <= tolerances))